@@ -97,7 +97,7 @@ class Cache:
 
         # make the cache key unique for each combination of dfs
         for df in context.dfs:
-            hash = df.column_hash()
+            hash = df.prompt_prefix_hash()
             cache_key += str(hash)
 
         return cache_key
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 
 import pandas as pd
@@ -44,21 +45,38 @@ except ImportError:
     pass
 
 
-def df_type(df: DataFrameType) -> Union[str, None]:
+@lru_cache(maxsize=16)
+def _df_type_by_cls(df_cls: type) -> Union[str, None]:
     """
-    Returns the type of the dataframe.
+    Returns the engine name for a dataframe class.
+
+    The set of dataframe classes seen in a process is tiny, so memoizing by
+    class turns the repeated isinstance dispatch into a dict lookup.
 
     Args:
-        df (DataFrameType): Pandas, Modin or Polars dataframe
+        df_cls (type): Class of the dataframe
 
     Returns:
         str: Type of the dataframe
     """
-    if polars_imported and isinstance(df, pl.DataFrame):
+    if polars_imported and issubclass(df_cls, pl.DataFrame):
         return "polars"
-    elif modin_imported and isinstance(df, mpd.DataFrame):
+    elif modin_imported and issubclass(df_cls, mpd.DataFrame):
         return "modin"
-    elif isinstance(df, pd.DataFrame):
+    elif issubclass(df_cls, pd.DataFrame):
         return "pandas"
     else:
         return None
+
+
+def df_type(df: DataFrameType) -> Union[str, None]:
+    """
+    Returns the type of the dataframe.
+
+    Args:
+        df (DataFrameType): Pandas, Modin or Polars dataframe
+
+    Returns:
+        str: Type of the dataframe
+    """
+    return _df_type_by_cls(type(df))
@@ -19,10 +19,11 @@ Example:
 """
 
 import hashlib
-import uuid
+import os
+import re
 from functools import cached_property
-from io import StringIO
 from typing import Any, List, Optional, Union
+from weakref import WeakValueDictionary, finalize
 
 import pandasai.pandas as pd
 from pandasai.helpers.df_validator import DfValidator
@@ -42,6 +43,31 @@ from ..smart_datalake import SmartDatalake
 from .abstract_df import DataframeAbstract
 
 
+def _truncate_values(values, max_size):
+    """
+    Truncate long strings in a 2D object array, in place.
+
+    A hand-rolled loop over the raw array is the fastest option available
+    here: object-dtype string cells cannot be JIT-compiled, and numpy's
+    element-wise wrappers re-dispatch per cell and allocate a new array.
+    """
+    for row in values:
+        for index, value in enumerate(row):
+            if isinstance(value, str) and len(value) > max_size:
+                row[index] = value[: max_size - 3] + "..."
+    return values
+
+
+# Maps file suffixes to the name of the reader on the pandas module. The
+# readers are looked up lazily so switching engines via `set_pd_engine`
+# keeps working.
+_FILE_READERS = {
+    ".csv": "read_csv",
+    ".parquet": "read_parquet",
+    ".xlsx": "read_excel",
+}
+
+
 class SmartDataframeCore:
     """
     A smart dataframe class is a wrapper around the pandas/polars dataframe that allows
@@ -54,6 +80,7 @@ class SmartDataframeCore:
     _temporary_loaded: bool = False
     _connector: BaseConnector = None
     _engine: str = None
+    _engine_df_cls: type = None
     _logger: Logger = None
 
     def __init__(self, df: DataFrameType, logger: Logger = None):
@@ -81,7 +108,7 @@ class SmartDataframeCore:
             # if the list can be converted to a dataframe, convert it
             # otherwise, raise an error
             try:
-                self.dataframe = pd.DataFrame(df)
+                self.dataframe = pd.DataFrame(df, copy=False)
             except ValueError as e:
                 raise ValueError(
                     "Invalid input data. We cannot convert it to a dataframe."
@@ -100,21 +127,34 @@ class SmartDataframeCore:
             pd.DataFrame: Pandas or Modin dataframe
         """
 
-        if file_path.endswith(".csv"):
-            return pd.read_csv(file_path)
-        elif file_path.endswith(".parquet"):
-            return pd.read_parquet(file_path)
-        elif file_path.endswith(".xlsx"):
-            return pd.read_excel(file_path)
-        elif file_path.startswith("https://docs.google.com/spreadsheets/"):
+        if file_path.startswith("https://docs.google.com/spreadsheets/"):
             return from_google_sheets(file_path)[0]
-        else:
+
+        ext = os.path.splitext(file_path)[1].lower()
+        if (reader := _FILE_READERS.get(ext)) is None:
             raise ValueError("Invalid file format.")
 
+        if ext == ".csv" and pd.__name__ == "pandas":
+            try:
+                # the multithreaded pyarrow parser is much faster than the
+                # default C parser on wide files, if pyarrow is installed
+                import pyarrow  # noqa: F401
+
+                return pd.read_csv(file_path, engine="pyarrow")
+            except ImportError:
+                pass
+
+        return getattr(pd, reader)(file_path)
+
     def _load_engine(self):
         """
         Load the engine of the dataframe (Pandas, Modin or Polars)
         """
+        # re-setting a dataframe of the same class (e.g. after
+        # load_connector) cannot change the engine, so skip the re-check
+        if type(self._df) is self._engine_df_cls:
+            return
+
         df_engine = df_type(self._df)
 
         if df_engine is None:
@@ -129,6 +169,7 @@ class SmartDataframeCore:
             )
 
         self._engine = df_engine
+        self._engine_df_cls = type(self._df)
 
     def _validate_and_convert_dataframe(self, df: DataFrameType) -> DataFrameType:
         """
@@ -146,7 +187,7 @@ class SmartDataframeCore:
             # if the list or dictionary can be converted to a dataframe, convert it
             # otherwise, raise an error
             try:
-                return pd.DataFrame(df)
+                return pd.DataFrame(df, copy=False)
             except ValueError as e:
                 raise ValueError(
                     "Invalid input data. We cannot convert it to a dataframe."
@@ -179,6 +220,16 @@ class SmartDataframeCore:
         self._df_loaded = False
         self._temporary_loaded = False
 
+    def _dataframe_view(self) -> DataFrameType:
+        """
+        Return the underlying dataframe without copying it.
+
+        This is reserved for internal read-only access (hashing, counting,
+        sampling, repr). User-facing code must go through the `dataframe`
+        property, which returns a defensive copy.
+        """
+        return self._df if self._df_loaded else None
+
     @property
     def dataframe(self) -> DataFrameType:
         if self._df_loaded:
@@ -204,6 +255,9 @@ class SmartDataframeCore:
         Args:
             df (DataFrameType): Pandas or Polars dataframe or path to a file
         """
+        if self._df is not None:
+            SmartDataframe.invalidate_column_hash(self._df)
+
         df = self._validate_and_convert_dataframe(df)
         self._df = df
 
@@ -227,13 +281,59 @@ class SmartDataframeCore:
         return self._connector is not None
 
 
+class _LakeDelegate:
+    """
+    Descriptor proxying a SmartDataframe attribute to its SmartDatalake,
+    replacing the identical property/setter pairs that used to be written
+    out by hand for every delegated attribute.
+    """
+
+    __slots__ = ("_name", "_settable")
+
+    def __init__(self, name: str = None, settable: bool = False):
+        self._name = name
+        self._settable = settable
+
+    def __set_name__(self, owner, name):
+        if self._name is None:
+            self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance._lake, self._name)
+
+    def __set__(self, instance, value):
+        if not self._settable:
+            raise AttributeError(f"can't set attribute {self._name!r}")
+        setattr(instance._lake, self._name, value)
+
+
 class SmartDataframe(DataframeAbstract, Shortcuts):
     _table_name: str
     _table_description: str
-    _custom_head: str = None
+    _custom_head: pd.DataFrame = None
     _original_import: any
     _core: SmartDataframeCore
     _lake: SmartDatalake
+    # (column hash, prompt-prefix hash) memo; see prompt_prefix_hash
+    _prefix_hash: tuple = None
+
+    # Parses "ConnectorName://host:port/database/table" import paths in a
+    # single pass; the port is optional.
+    _import_path_regex = re.compile(
+        r"^(?P<name>[^:]+)://(?P<host>[^:/]*):(?P<port>[^/]*)"
+        r"/(?P<database>[^/]+)/(?P<table>.+)$"
+    )
+
+    # Attribute names of the core wrapper, precomputed once for O(1)
+    # membership checks in __getattr__.
+    _core_attrs = frozenset(dir(SmartDataframeCore))
+
+    # Memoized column hashes, shared across instances wrapping the same
+    # underlying dataframe. Keyed on the dataframe identity and its column
+    # count so a stale entry is never served after an in-place column change.
+    _column_hash_cache: dict = {}
 
     def __init__(
         self,
@@ -290,8 +390,15 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
         if self.connector:
             self._table_name = self.connector.fallback_name
 
+            # Connectors are queried lazily by default: the hash and sample
+            # head come from connector metadata and the full query only runs
+            # (with any filters pushed down) when generated code needs rows.
+            # Materialize eagerly only if the user opted out of lazy loading.
+            if not self._lake.config.lazy_load_connector:
+                self.load_connector()
+
         if custom_head is not None:
-            self._custom_head = custom_head.to_csv(index=False)
+            self._custom_head = custom_head.copy()
 
     def add_skills(self, *skills: Skill):
         """
@@ -332,9 +439,63 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
         if not self._core._df_loaded and self.connector:
             return self.connector.column_hash
 
-        columns_str = "".join(self.dataframe.columns)
-        hash_object = hashlib.sha256(columns_str.encode())
-        return hash_object.hexdigest()
+        df = self._dataframe_view()
+        key = (id(df), df.shape[1])
+        if (cached_hash := self._column_hash_cache.get(key)) is not None:
+            return cached_hash
+
+        hash_object = hashlib.blake2b(digest_size=16)
+        for column in df.columns:
+            hash_object.update(str(column).encode("utf-8"))
+            # a separator keeps ["ab", "c"] and ["a", "bc"] distinct
+            hash_object.update(b"\x00")
+        self._column_hash_cache[key] = hash_object.hexdigest()
+        # evict the entry when the dataframe is garbage collected, so the
+        # cache cannot grow unbounded or serve a recycled id()
+        finalize(df, self._column_hash_cache.pop, key, None)
+        return self._column_hash_cache[key]
+
+    def prompt_prefix_hash(self) -> str:
+        """
+        Get a hash of everything about this dataframe that flows into the
+        prompt prefix: the column hash, the dtypes and the custom head. The
+        result is cached until the dataframe or the custom head changes, so
+        cache lookups don't have to rebuild any prompt text.
+
+        Returns:
+            str: Hash of the prompt prefix contribution of this dataframe
+        """
+        # the memo is guarded by the column hash, so an in-place schema
+        # change that refreshes column_hash also refreshes this hash
+        column_hash = self.column_hash()
+        if self._prefix_hash is not None and self._prefix_hash[0] == column_hash:
+            return self._prefix_hash[1]
+
+        hash_object = hashlib.blake2b(digest_size=16)
+        hash_object.update(column_hash.encode())
+
+        if (df := self._dataframe_view()) is not None:
+            for dtype in df.dtypes:
+                hash_object.update(str(dtype).encode("utf-8"))
+                hash_object.update(b"\x00")
+
+        if self._custom_head is not None:
+            hash_object.update(self._custom_head.to_csv(index=False).encode("utf-8"))
+
+        self._prefix_hash = (column_hash, hash_object.hexdigest())
+        return self._prefix_hash[1]
+
+    @classmethod
+    def invalidate_column_hash(cls, df: DataFrameType):
+        """
+        Drop any memoized column hash for the given dataframe.
+
+        Args:
+            df (DataFrameType): Pandas, Modin or Polars dataframe
+        """
+        df_id = id(df)
+        for key in [key for key in cls._column_hash_cache if key[0] == df_id]:
+            del cls._column_hash_cache[key]
 
     def save(self, name: str = None):
         """
@@ -356,22 +517,23 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
             Defaults to False.
         """
         self._core.load_connector(temporary)
+        self._prefix_hash = None
+        self.__dict__.pop("rows_count", None)
+        self.__dict__.pop("columns_count", None)
 
     def _instantiate_connector(self, import_path: str) -> BaseConnector:
-        connector_name = import_path.split("://")[0]
-        connector_path = import_path.split("://")[1]
-        connector_host = connector_path.split(":")[0]
-        connector_port = connector_path.split(":")[1].split("/")[0]
-        connector_database = connector_path.split(":")[1].split("/")[1]
-        connector_table = connector_path.split(":")[1].split("/")[2]
+        match = self._import_path_regex.match(import_path)
+        if match is None:
+            raise ValueError(f"Invalid connector import path: {import_path}")
 
+        connector_name = match["name"]
         connector_data = {
-            "host": connector_host,
-            "database": connector_database,
-            "table": connector_table,
+            "host": match["host"],
+            "database": match["database"],
+            "table": match["table"],
         }
-        if connector_port:
-            connector_data["port"] = connector_port
+        if match["port"]:
+            connector_data["port"] = match["port"]
 
         # instantiate the connector
         return getattr(
@@ -390,26 +552,35 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
             DataFrameType: Pandas, Modin or Polars dataframe
         """
         if (engine := df_type(df)) in ("pandas", "modin"):
-            df_trunc = df.copy()
-
-            for col in df.columns:
-                if df[col].dtype == "object":
-                    first_val = df[col].iloc[0]
-                    if isinstance(first_val, str) and len(first_val) > max_size:
-                        df_trunc[col] = f"{df_trunc[col].str.slice(0, max_size - 3)}..."
+            # build the truncated frame column by column instead of copying the
+            # whole frame upfront; untouched columns are reused as-is
+            columns = {col: df[col] for col in df.columns}
+            str_cols = df.select_dtypes(include="object").columns
+
+            if len(str_cols):
+                # one batched pass over a single object array instead of a
+                # str-accessor dispatch per column
+                values = _truncate_values(df[str_cols].to_numpy(), max_size)
+                for index, col in enumerate(str_cols):
+                    columns[col] = values[:, index]
+
+            df_trunc = pd.DataFrame(columns, copy=False, index=df.index)
         elif engine == "polars":
             try:
                 import polars as pl
 
-                df_trunc = df.clone()
-
-                for col in df.columns:
-                    if df[col].dtype == pl.Utf8:
-                        first_val = df[col][0]
-                        if isinstance(first_val, str) and len(df_trunc[col]) > max_size:
-                            df_trunc[
-                                col
-                            ] = f"{df_trunc[col].str.slice(0, max_size - 3)}..."
+                str_cols = [col for col in df.columns if df[col].dtype == pl.Utf8]
+
+                if str_cols:
+                    # one expression-engine pass for all string columns
+                    df_trunc = df.with_columns(
+                        pl.when(pl.col(col).str.n_chars() > max_size)
+                        .then(pl.col(col).str.slice(0, max_size - 3) + "...")
+                        .otherwise(pl.col(col))
+                        for col in str_cols
+                    )
+                else:
+                    df_trunc = df.clone()
             except ImportError as e:
                 raise ImportError(
                     "Polars is not installed. "
@@ -426,21 +597,25 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
         head = None
         rows_to_display = 0 if self.lake.config.enforce_privacy else 3
         if self._custom_head is not None:
-            head = self.custom_head
+            head = self._custom_head
         elif not self._core._df_loaded and self.connector:
             head = self.connector.head()
         else:
-            head = self.dataframe.head(rows_to_display)
+            head = self._dataframe_view().head(rows_to_display)
 
         if head is None:
             return None
 
+        if self.lake.config.enforce_privacy:
+            # no rows are sent in privacy mode, so sampling and anonymizing
+            # would only shuffle an empty frame; keep the columns only
+            if df_type(head) == "polars":
+                head = head.to_pandas()
+            return head.head(0)
+
         sampler = DataSampler(head)
         sampled_head = sampler.sample(rows_to_display)
-        if self.lake.config.enforce_privacy:
-            return sampled_head
-        else:
-            return self._truncate_head_columns(sampled_head)
+        return self._truncate_head_columns(sampled_head)
 
     def _load_from_config(self, name: str):
         """
@@ -450,6 +625,13 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
         config_manager = DfConfigManager(self)
         return config_manager.load(name)
 
+    def _dataframe_view(self) -> DataFrameType:
+        """
+        Return the underlying dataframe without copying it, for internal
+        read-only access only.
+        """
+        return self._core._dataframe_view()
+
     @property
     def dataframe(self) -> DataFrameType:
         return self._core.dataframe
@@ -485,10 +667,10 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
     def lake(self, lake: SmartDatalake):
         self._lake = lake
 
-    @property
+    @cached_property
     def rows_count(self):
         if self._core._df_loaded:
-            return self.dataframe.shape[0]
+            return self._dataframe_view().shape[0]
         elif self.connector is not None:
             return self.connector.rows_count
         else:
@@ -496,10 +678,10 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
                 "Cannot determine rows_count. No dataframe or connector loaded."
             )
 
-    @property
+    @cached_property
     def columns_count(self):
         if self._core._df_loaded:
-            return self.dataframe.shape[1]
+            return self._dataframe_view().shape[1]
         elif self.connector is not None:
             return self.connector.columns_count
         else:
@@ -528,139 +710,30 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
         df_head = self._get_sample_head()
         return df_head.to_csv(index=False)
 
-    @property
-    def last_prompt(self):
-        return self.lake.last_prompt
-
-    @property
-    def last_prompt_id(self) -> uuid.UUID:
-        return self.lake.last_prompt_id
-
-    @property
-    def last_code_generated(self):
-        return self.lake.last_code_executed
-
-    @property
-    def last_code_executed(self):
-        return self.lake.last_code_executed
-
-    @property
-    def last_result(self):
-        return self.lake.last_result
-
-    @property
-    def last_error(self):
-        return self.lake.last_error
-
-    @property
-    def cache(self):
-        return self.lake.cache
+    last_prompt = _LakeDelegate()
+    last_prompt_id = _LakeDelegate()
+    last_code_generated = _LakeDelegate("last_code_executed")
+    last_code_executed = _LakeDelegate()
+    last_result = _LakeDelegate()
+    last_error = _LakeDelegate()
+    cache = _LakeDelegate()
+    logger: Logger = _LakeDelegate(settable=True)
+    logs = _LakeDelegate()
+    verbose: bool = _LakeDelegate(settable=True)
+    save_logs: bool = _LakeDelegate(settable=True)
+    enforce_privacy: bool = _LakeDelegate(settable=True)
+    enable_cache: bool = _LakeDelegate(settable=True)
+    use_error_correction_framework: bool = _LakeDelegate(settable=True)
+    custom_prompts: dict = _LakeDelegate(settable=True)
+    save_charts: bool = _LakeDelegate(settable=True)
+    save_charts_path: str = _LakeDelegate(settable=True)
+    custom_whitelisted_dependencies: List[str] = _LakeDelegate(settable=True)
+    max_retries: int = _LakeDelegate(settable=True)
+    llm: Union[LLM, LangchainLLM] = _LakeDelegate(settable=True)
 
     def original_import(self):
         return self._original_import
 
-    @property
-    def logger(self):
-        return self.lake.logger
-
-    @logger.setter
-    def logger(self, logger: Logger):
-        self.lake.logger = logger
-
-    @property
-    def logs(self):
-        return self.lake.logs
-
-    @property
-    def verbose(self):
-        return self.lake.verbose
-
-    @verbose.setter
-    def verbose(self, verbose: bool):
-        self.lake.verbose = verbose
-
-    @property
-    def save_logs(self):
-        return self.lake.save_logs
-
-    @save_logs.setter
-    def save_logs(self, save_logs: bool):
-        self.lake.save_logs = save_logs
-
-    @property
-    def enforce_privacy(self):
-        return self.lake.enforce_privacy
-
-    @enforce_privacy.setter
-    def enforce_privacy(self, enforce_privacy: bool):
-        self.lake.enforce_privacy = enforce_privacy
-
-    @property
-    def enable_cache(self):
-        return self.lake.enable_cache
-
-    @enable_cache.setter
-    def enable_cache(self, enable_cache: bool):
-        self.lake.enable_cache = enable_cache
-
-    @property
-    def use_error_correction_framework(self):
-        return self.lake.use_error_correction_framework
-
-    @use_error_correction_framework.setter
-    def use_error_correction_framework(self, use_error_correction_framework: bool):
-        self.lake.use_error_correction_framework = use_error_correction_framework
-
-    @property
-    def custom_prompts(self):
-        return self.lake.custom_prompts
-
-    @custom_prompts.setter
-    def custom_prompts(self, custom_prompts: dict):
-        self.lake.custom_prompts = custom_prompts
-
-    @property
-    def save_charts(self):
-        return self.lake.save_charts
-
-    @save_charts.setter
-    def save_charts(self, save_charts: bool):
-        self.lake.save_charts = save_charts
-
-    @property
-    def save_charts_path(self):
-        return self.lake.save_charts_path
-
-    @save_charts_path.setter
-    def save_charts_path(self, save_charts_path: str):
-        self.lake.save_charts_path = save_charts_path
-
-    @property
-    def custom_whitelisted_dependencies(self):
-        return self.lake.custom_whitelisted_dependencies
-
-    @custom_whitelisted_dependencies.setter
-    def custom_whitelisted_dependencies(
-        self, custom_whitelisted_dependencies: List[str]
-    ):
-        self.lake.custom_whitelisted_dependencies = custom_whitelisted_dependencies
-
-    @property
-    def max_retries(self):
-        return self.lake.max_retries
-
-    @max_retries.setter
-    def max_retries(self, max_retries: int):
-        self.lake.max_retries = max_retries
-
-    @property
-    def llm(self):
-        return self.lake.llm
-
-    @llm.setter
-    def llm(self, llm: Union[LLM, LangchainLLM]):
-        self.lake.llm = llm
-
     @property
     def table_name(self):
         return self._table_name
@@ -671,44 +744,62 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
 
     @property
     def custom_head(self):
-        data = StringIO(self._custom_head)
-        return pd.read_csv(data)
+        return self._custom_head.copy()
 
     @custom_head.setter
     def custom_head(self, custom_head: pd.DataFrame):
-        self._custom_head = custom_head.to_csv(index=False)
+        self._custom_head = custom_head.copy()
+        self._prefix_hash = None
 
-    @property
-    def last_query_log_id(self):
-        return self._lake.last_query_log_id
+    last_query_log_id = _LakeDelegate()
+
+    def _df_attrs(self) -> frozenset:
+        """
+        Attribute names of the wrapped dataframe, memoized per dataframe
+        (including its column count, since columns are exposed as attributes)
+        so __getattr__ does not rebuild the dir() list on every missed lookup.
+        """
+        df = self._core._df
+        key = (id(df), df.shape[1] if df is not None else None)
+        memo = self.__dict__.get("_df_attrs_memo")
+        if memo is None or memo[0] != key:
+            memo = (key, frozenset(dir(df)))
+            self.__dict__["_df_attrs_memo"] = memo
+        return memo[1]
 
     def __getattr__(self, name):
-        if name in self._core.__dir__():
+        if name in self._core_attrs:
             return getattr(self._core, name)
-        elif name in self.dataframe.__dir__():
-            return getattr(self.dataframe, name)
+        elif name in self._df_attrs():
+            return getattr(self._dataframe_view(), name)
         else:
             return self.__getattribute__(name)
 
     def __getitem__(self, key):
-        return self.dataframe.__getitem__(key)
+        return self._dataframe_view().__getitem__(key)
 
     def __setitem__(self, key, value):
         return self.dataframe.__setitem__(key, value)
 
     def __dir__(self):
-        return dir(self._core) + dir(self.dataframe) + dir(self.__class__)
+        return sorted(self._core_attrs | self._df_attrs() | set(dir(self.__class__)))
 
     def __repr__(self):
-        return self.dataframe.__repr__()
+        return self._dataframe_view().__repr__()
 
     def __len__(self):
-        return len(self.dataframe)
+        return len(self._dataframe_view())
 
     def __eq__(self, other):
-        if isinstance(other, self.__class__) and (
-            self._core.has_connector and other._core.has_connector
-        ):
+        if self is other:
+            return True
+
+        if not isinstance(other, self.__class__):
+            return False
+
+        if self._core.has_connector and other._core.has_connector:
+            if not isinstance(other._core.connector, type(self._core.connector)):
+                return False
             return self._core.connector.equals(other._core.connector)
 
         return False
@@ -720,6 +811,12 @@ class SmartDataframe(DataframeAbstract, Shortcuts):
         return self._core.connector.execute_direct_sql_query
 
 
+# SmartDataframes already built for a given (dataframe, config) pair, so
+# repeated loads of the same inputs don't rebuild the whole wrapper. Entries
+# disappear as soon as the SmartDataframe is garbage collected.
+_loaded_smartdataframes = WeakValueDictionary()
+
+
 def load_smartdataframes(
     dfs: List[Union[DataFrameType, Any]], config: Config
 ) -> List[SmartDataframe]:
@@ -732,9 +829,15 @@ def load_smartdataframes(
 
     smart_dfs = []
     for df in dfs:
-        if not isinstance(df, SmartDataframe):
-            smart_dfs.append(SmartDataframe(df, config=config))
-        else:
+        if isinstance(df, SmartDataframe):
             smart_dfs.append(df)
+            continue
+
+        key = (id(df), id(config))
+        cached = _loaded_smartdataframes.get(key)
+        if cached is None or cached.original_import() is not df:
+            cached = SmartDataframe(df, config=config)
+            _loaded_smartdataframes[key] = cached
+        smart_dfs.append(cached)
 
     return smart_dfs
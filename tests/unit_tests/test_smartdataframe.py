@@ -6,7 +6,7 @@ import sys
 from collections import defaultdict
 from typing import Optional
 from unittest.mock import Mock, patch
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pandas as pd
 import polars as pl
@@ -1008,6 +1008,76 @@ result = {"type": None, "value": "temp_chart.png"}
         with patch("pandasai.smart_dataframe.DataSampler", new=data_sampler):
             assert smart_dataframe.head_csv == custom_head.to_csv(index=False)
 
+    def test_truncate_head_columns(self, smart_dataframe: SmartDataframe):
+        df = pd.DataFrame(
+            {
+                "text": ["a" * 30, "short", None],
+                "number": [1, 2, 3],
+            }
+        )
+
+        truncated = smart_dataframe._truncate_head_columns(df)
+
+        assert truncated["text"].iloc[0] == "a" * 22 + "..."
+        assert truncated["text"].iloc[1] == "short"
+        assert truncated["text"].iloc[2] is None
+        assert truncated["number"].tolist() == [1, 2, 3]
+
+    def test_truncate_head_columns_polars(self, smart_dataframe: SmartDataframe):
+        df = pl.DataFrame(
+            {
+                "text": ["a" * 30, "short", None],
+                "number": [1, 2, 3],
+            }
+        )
+
+        truncated = smart_dataframe._truncate_head_columns(df)
+
+        assert truncated["text"][0] == "a" * 22 + "..."
+        assert truncated["text"][1] == "short"
+        assert truncated["text"][2] is None
+        assert truncated["number"].to_list() == [1, 2, 3]
+
+    def test_prompt_prefix_hash_includes_dtypes(self, llm):
+        df_int = SmartDataframe(
+            pd.DataFrame({"A": [1, 2]}),
+            config={"llm": llm, "enable_cache": False},
+        )
+        df_float = SmartDataframe(
+            pd.DataFrame({"A": [1.0, 2.0]}),
+            config={"llm": llm, "enable_cache": False},
+        )
+
+        assert df_int.column_hash() == df_float.column_hash()
+        assert df_int.prompt_prefix_hash() != df_float.prompt_prefix_hash()
+
+    def test_prompt_prefix_hash_invalidation(
+        self, llm, sample_df, custom_head: pd.DataFrame
+    ):
+        df_object = SmartDataframe(
+            sample_df,
+            config={"llm": llm, "enable_cache": False},
+            custom_head=custom_head,
+        )
+
+        hash_before = df_object.prompt_prefix_hash()
+        assert df_object.prompt_prefix_hash() == hash_before
+
+        df_object.custom_head = pd.DataFrame({"A": [9], "B": [10]})
+        assert df_object.prompt_prefix_hash() != hash_before
+
+    def test_cache_key_uses_prompt_prefix_hash(self, smart_dataframe: SmartDataframe):
+        cache = Cache(filename=f"cache_{uuid4().hex}")
+        try:
+            context = Mock()
+            context.memory.get_conversation.return_value = "question"
+            context.dfs = [smart_dataframe]
+
+            cache_key = cache.get_cache_key(context)
+            assert cache_key == "question" + smart_dataframe.prompt_prefix_hash()
+        finally:
+            cache.destroy()
+
     @pytest.mark.parametrize(
         "viz_library_type,viz_library_type_hint",
         [